@@ -1,10 +1,11 @@
 import logging
+import os
 import signal
-import uuid
+import socket
 from concurrent.futures import ThreadPoolExecutor
-from contextlib import closing
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from datetime import timedelta
-from typing import Any, Optional, Sequence
+from typing import Any, Mapping, Optional, Sequence, Tuple
 
 import click
 from arroyo import Topic
@@ -33,6 +34,23 @@ from snuba.utils.streams.metrics_adapter import StreamMetricsAdapter
 
 logger = logging.getLogger(__name__)
 
+# Batch size, batch time and producer linger (both in milliseconds) presets
+# trading subscription latency for throughput. ``low-latency`` keeps batches
+# small and short and barely lingers in the producer so results are not held
+# back waiting for a batch to fill up.
+BATCHING_MODES: Mapping[str, Tuple[int, int, int]] = {
+    "low-latency": (10, 50, 5),
+    "balanced": (1000, 500, 100),
+    "throughput": (10000, 2000, 500),
+}
+
+DEFAULT_PRODUCER_LINGER_MS = 100
+
+# How long to wait for pending results to be produced before closing the
+# consumer during shutdown. This does not bound the flush itself: the producer
+# keeps flushing on its own thread and the process only exits once it is done.
+PRODUCER_CLOSE_TIMEOUT_SECONDS = 10
+
 
 @click.command()
 @click.option(
@@ -80,6 +98,21 @@ logger = logging.getLogger(__name__)
     type=int,
     help="Max length of time to buffer messages in memory before writing to Kafka.",
 )
+@click.option(
+    "--mode",
+    type=click.Choice(list(BATCHING_MODES.keys())),
+    help="Batching preset, overrides --max-batch-size and --max-batch-time-ms. Also sets the producer linger unless --producer-linger-ms is provided.",
+)
+@click.option(
+    "--queued-max-messages-kbytes",
+    type=int,
+    help="Maximum number of kilobytes per topic+partition in the local consumer queue. Defaults to the arroyo consumer default.",
+)
+@click.option(
+    "--queued-min-messages",
+    type=int,
+    help="Minimum number of messages per topic+partition librdkafka tries to maintain in the local consumer queue. Defaults to the arroyo consumer default.",
+)
 @click.option(
     "--max-query-workers",
     type=int,
@@ -87,6 +120,11 @@ logger = logging.getLogger(__name__)
 )
 @click.option("--schedule-ttl", type=int, default=60 * 5)
 @click.option("--result-topic")
+@click.option(
+    "--producer-linger-ms",
+    type=int,
+    help=f"Time to wait for result messages to accumulate into a batch before producing them. Takes precedence over the linger of --mode. Defaults to the --mode linger, or {DEFAULT_PRODUCER_LINGER_MS} without a mode.",
+)
 @click.option("--log-level", help="Logging level to use.")
 @click.option("--delay-seconds", type=int)
 def subscriptions(
@@ -101,9 +139,13 @@ def subscriptions(
     bootstrap_servers: Sequence[str],
     max_batch_size: int,
     max_batch_time_ms: int,
+    mode: Optional[str],
+    queued_max_messages_kbytes: Optional[int],
+    queued_min_messages: Optional[int],
     max_query_workers: Optional[int],
     schedule_ttl: int,
     result_topic: Optional[str],
+    producer_linger_ms: Optional[int],
     log_level: Optional[str],
     delay_seconds: Optional[int],
 ) -> None:
@@ -112,6 +154,14 @@ def subscriptions(
     setup_logging(log_level)
     setup_sentry()
 
+    if mode is not None:
+        max_batch_size, max_batch_time_ms, mode_linger_ms = BATCHING_MODES[mode]
+        if producer_linger_ms is None:
+            producer_linger_ms = mode_linger_ms
+
+    if producer_linger_ms is None:
+        producer_linger_ms = DEFAULT_PRODUCER_LINGER_MS
+
     dataset = get_dataset(dataset_name)
 
     storage = dataset.get_default_entity().get_writable_storage()
@@ -126,6 +176,22 @@ def subscriptions(
     result_topic_spec = loader.get_subscription_result_topic_spec()
     assert result_topic_spec is not None
 
+    source_topic = (
+        Topic(topic)
+        if topic is not None
+        else Topic(loader.get_default_topic_spec().topic_name)
+    )
+    commit_log_source_topic = (
+        Topic(commit_log_topic)
+        if commit_log_topic is not None
+        else Topic(commit_log_topic_spec.topic_name)
+    )
+    result_destination_topic = (
+        Topic(result_topic)
+        if result_topic is not None
+        else Topic(result_topic_spec.topic_name)
+    )
+
     metrics = MetricsWrapper(
         environment.metrics,
         "subscriptions",
@@ -139,22 +205,26 @@ def subscriptions(
                     loader.get_default_topic_spec().topic,
                     consumer_group,
                     auto_offset_reset=auto_offset_reset,
+                    queued_max_messages_kbytes=queued_max_messages_kbytes,
+                    queued_min_messages=queued_min_messages,
                     bootstrap_servers=bootstrap_servers,
                 ),
             ),
             KafkaConsumer(
                 build_kafka_consumer_configuration(
                     commit_log_topic_spec.topic,
-                    f"subscriptions-commit-log-{uuid.uuid1().hex}",
+                    # The commit log consumer needs to be assigned every
+                    # partition, so the group must not be shared with any
+                    # other process. Host names are not unique per process
+                    # (several consumers on a VM, hostNetwork pods), so the
+                    # pid is included as well. Offsets are never committed
+                    # for it, so it always starts from the earliest offset.
+                    f"{consumer_group}-commit-log-{socket.gethostname()}-{os.getpid()}",
                     auto_offset_reset="earliest",
                     bootstrap_servers=bootstrap_servers,
                 ),
             ),
-            (
-                Topic(commit_log_topic)
-                if commit_log_topic is not None
-                else Topic(commit_log_topic_spec.topic_name)
-            ),
+            commit_log_source_topic,
             set(commit_log_groups),
         ),
         time_shift=(
@@ -170,10 +240,21 @@ def subscriptions(
                 override_params={
                     "partitioner": "consistent",
                     "message.max.bytes": 50000000,  # 50MB, default is 1MB
+                    # Allow librdkafka to coalesce many results into a single
+                    # produce request rather than sending them one by one.
+                    "linger.ms": producer_linger_ms,
+                    "batch.num.messages": 65536,
+                    "compression.type": "lz4",
+                    "queue.buffering.max.messages": 1_000_000,
+                    "queue.buffering.max.kbytes": 1_048_576,
+                    "socket.send.buffer.bytes": 1_048_576,
                 },
             )
         ),
         SubscriptionTaskResultEncoder(),
+        # A single worker ensures results are produced in the order in which
+        # they were submitted.
+        ThreadPoolExecutor(max_workers=1),
     )
 
     executor = ThreadPoolExecutor(max_workers=max_query_workers)
@@ -182,17 +263,13 @@ def subscriptions(
     )
     metrics.gauge("executor.workers", getattr(executor, "_max_workers", 0))
 
-    with closing(consumer), executor, closing(producer):
+    try:
         from arroyo import configure_metrics
 
         configure_metrics(StreamMetricsAdapter(metrics))
         batching_consumer = StreamProcessor(
             consumer,
-            (
-                Topic(topic)
-                if topic is not None
-                else Topic(loader.get_default_topic_spec().topic_name)
-            ),
+            source_topic,
             BatchProcessingStrategyFactory(
                 SubscriptionWorker(
                     dataset,
@@ -213,9 +290,7 @@ def subscriptions(
                         )
                     },
                     producer,
-                    Topic(result_topic)
-                    if result_topic is not None
-                    else Topic(result_topic_spec.topic_name),
+                    result_destination_topic,
                     metrics,
                 ),
                 max_batch_size,
@@ -230,3 +305,18 @@ def subscriptions(
         signal.signal(signal.SIGTERM, handler)
 
         batching_consumer.run()
+    finally:
+        # Shut down in order: wait for any in-flight queries to complete,
+        # then wait for their results to be produced, and finally close the
+        # consumer, even if closing the producer failed.
+        executor.shutdown()
+        try:
+            producer.close().result(timeout=PRODUCER_CLOSE_TIMEOUT_SECONDS)
+        except FutureTimeoutError:
+            logger.warning(
+                "Producer did not finish flushing within %s seconds, closing the "
+                "consumer. The process will exit once pending results are flushed.",
+                PRODUCER_CLOSE_TIMEOUT_SECONDS,
+            )
+        finally:
+            consumer.close()
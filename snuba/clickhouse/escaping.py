@@ -1,5 +1,5 @@
 import re
-
+from functools import lru_cache
 from typing import Optional, Pattern
 
 ESCAPE_STRING_RE = re.compile(r"(['\\])")
@@ -38,5 +38,8 @@ def escape_alias(alias: Optional[str]) -> Optional[str]:
     return escape_expression(alias, SAFE_ALIAS_RE)
 
 
+# Identifiers are escaped every time a query is formatted and the same
+# columns and functions show up in most queries.
+@lru_cache(maxsize=1024)
 def escape_identifier(col: Optional[str]) -> Optional[str]:
     return escape_expression(col, SAFE_COL_RE)
@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Optional, Sequence
 
 from snuba.clickhouse.translators.snuba import SnubaClickhouseStrictTranslator
 from snuba.clickhouse.translators.snuba.allowed import (
@@ -14,6 +14,7 @@ from snuba.query.expressions import (
     Argument,
     Column,
     CurriedFunctionCall,
+    Expression,
     FunctionCall,
     Lambda,
     Literal,
@@ -21,6 +22,17 @@ from snuba.query.expressions import (
 )
 
 
+def _unchanged(
+    translated: Sequence[Expression], original: Sequence[Expression]
+) -> bool:
+    """
+    Returns True if every translated expression is the original one. In
+    that case the default mappers return the original expression: it is
+    immutable so there is no need for a copy.
+    """
+    return all(t is o for t, o in zip(translated, original))
+
+
 class DefaultLiteralMapper(LiteralMapper):
     def attempt_map(
         self, expression: Literal, children_translator: SnubaClickhouseStrictTranslator,
@@ -50,6 +62,8 @@ class DefaultSubscriptableMapper(SubscriptableReferenceMapper):
         assert isinstance(column, Column)
         key = expression.key.accept(children_translator)
         assert isinstance(key, Literal)
+        if column is expression.column and key is expression.key:
+            return expression
         return SubscriptableReference(alias=expression.alias, column=column, key=key)
 
 
@@ -59,12 +73,13 @@ class DefaultFunctionMapper(FunctionCallMapper):
         expression: FunctionCall,
         children_translator: SnubaClickhouseStrictTranslator,
     ) -> Optional[FunctionCall]:
+        parameters = tuple(p.accept(children_translator) for p in expression.parameters)
+        if _unchanged(parameters, expression.parameters):
+            return expression
         return FunctionCall(
             alias=expression.alias,
             function_name=expression.function_name,
-            parameters=tuple(
-                p.accept(children_translator) for p in expression.parameters
-            ),
+            parameters=parameters,
         )
 
 
@@ -74,14 +89,18 @@ class DefaultCurriedFunctionMapper(CurriedFunctionCallMapper):
         expression: CurriedFunctionCall,
         children_translator: SnubaClickhouseStrictTranslator,
     ) -> Optional[CurriedFunctionCall]:
+        internal_function = children_translator.translate_function_strict(
+            expression.internal_function
+        )
+        parameters = tuple(p.accept(children_translator) for p in expression.parameters)
+        if internal_function is expression.internal_function and _unchanged(
+            parameters, expression.parameters
+        ):
+            return expression
         return CurriedFunctionCall(
             alias=expression.alias,
-            internal_function=children_translator.translate_function_strict(
-                expression.internal_function
-            ),
-            parameters=tuple(
-                p.accept(children_translator) for p in expression.parameters
-            ),
+            internal_function=internal_function,
+            parameters=parameters,
         )
 
 
@@ -98,8 +117,11 @@ class DefaultLambdaMapper(LambdaMapper):
     def attempt_map(
         self, expression: Lambda, children_translator: SnubaClickhouseStrictTranslator,
     ) -> Optional[Lambda]:
+        transformation = expression.transformation.accept(children_translator)
+        if transformation is expression.transformation:
+            return expression
         return Lambda(
             alias=expression.alias,
             parameters=expression.parameters,
-            transformation=expression.transformation.accept(children_translator),
+            transformation=transformation,
         )
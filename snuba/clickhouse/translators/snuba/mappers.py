@@ -140,9 +140,12 @@ class SubscriptableMapper(SubscriptableReferenceMapper):
         expression: SubscriptableReference,
         children_translator: SnubaClickhouseStrictTranslator,
     ) -> Optional[FunctionCallExpr]:
+        # The column name is compared first since, contrarily to the table
+        # name, it is different for almost every other mapper.
+        column = expression.column
         if (
-            expression.column.table_name == self.from_column_table
-            and expression.column.column_name == self.from_column_name
+            column.column_name == self.from_column_name
+            and column.table_name == self.from_column_table
         ):
             key = expression.key.accept(children_translator)
             return (
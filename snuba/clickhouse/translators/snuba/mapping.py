@@ -1,7 +1,21 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field
-from typing import MutableMapping, Sequence
+from dataclasses import dataclass, field, fields
+from typing import (
+    Any,
+    Callable,
+    FrozenSet,
+    Generic,
+    List,
+    Mapping,
+    MutableMapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+    cast,
+)
 
 from snuba.clickhouse.query import Expression
 from snuba.clickhouse.translators.snuba import SnubaClickhouseStrictTranslator
@@ -23,7 +37,11 @@ from snuba.clickhouse.translators.snuba.defaults import (
     DefaultLiteralMapper,
     DefaultSubscriptableMapper,
 )
-from snuba.datasets.plans.translator.mapper import apply_mappers
+from snuba.clickhouse.translators.snuba.mappers import (
+    ColumnToExpression,
+    SubscriptableMapper,
+)
+from snuba.datasets.plans.translator.mapper import ExpressionMapper, apply_mappers
 from snuba.query.expressions import (
     Argument,
     Column,
@@ -34,6 +52,57 @@ from snuba.query.expressions import (
     SubscriptableReference,
 )
 
+TMapper = TypeVar("TMapper")
+MapperKey = Tuple[str, Optional[str]]
+
+
+class _MapperIndex(Generic[TMapper]):
+    """
+    Indexes a sequence of mappers by the (column name, table name) pair the
+    mappers apply to, so that only the mappers that can possibly match an
+    expression are tried instead of the whole sequence.
+
+    Mappers that apply to a single pair always map the expressions with
+    that pair. Any other mapper is tried on every expression. The order of
+    the sequence is preserved, so the first mapper that matches is the
+    same as when trying the whole sequence.
+    """
+
+    def __init__(
+        self,
+        mappers: Sequence[TMapper],
+        get_key: Callable[[TMapper], Optional[MapperKey]],
+    ) -> None:
+        unkeyed: List[TMapper] = []
+        by_key: MutableMapping[MapperKey, Sequence[TMapper]] = {}
+        for mapper in mappers:
+            key = get_key(mapper)
+            if key is None:
+                unkeyed.append(mapper)
+            elif key not in by_key:
+                # The mappers after the first one with the same key would
+                # never be reached.
+                by_key[key] = (*unkeyed, mapper)
+        self.__unkeyed: Sequence[TMapper] = tuple(unkeyed)
+        self.__by_key = by_key
+
+    def get(self, key: MapperKey) -> Sequence[TMapper]:
+        return self.__by_key.get(key, self.__unkeyed)
+
+
+def _get_column_mapper_key(mapper: ColumnMapper) -> Optional[MapperKey]:
+    if isinstance(mapper, ColumnToExpression):
+        return (mapper.from_col_name, mapper.from_table_name)
+    return None
+
+
+def _get_subscriptable_mapper_key(
+    mapper: SubscriptableReferenceMapper,
+) -> Optional[MapperKey]:
+    if isinstance(mapper, SubscriptableMapper):
+        return (mapper.from_column_name, mapper.from_column_table)
+    return None
+
 
 @dataclass(frozen=True)
 class TranslationMappers:
@@ -54,26 +123,76 @@ class TranslationMappers:
     See allowed.py for the valid translation rules and their reasoning.
     """
 
-    literals: Sequence[LiteralMapper] = field(default_factory=list)
-    columns: Sequence[ColumnMapper] = field(default_factory=list)
-    subscriptables: Sequence[SubscriptableReferenceMapper] = field(default_factory=list)
-    functions: Sequence[FunctionCallMapper] = field(default_factory=list)
-    curried_functions: Sequence[CurriedFunctionCallMapper] = field(default_factory=list)
-    arguments: Sequence[ArgumentMapper] = field(default_factory=list)
-    lambdas: Sequence[LambdaMapper] = field(default_factory=list)
+    literals: Sequence[LiteralMapper] = field(default_factory=tuple)
+    columns: Sequence[ColumnMapper] = field(default_factory=tuple)
+    subscriptables: Sequence[SubscriptableReferenceMapper] = field(
+        default_factory=tuple
+    )
+    functions: Sequence[FunctionCallMapper] = field(default_factory=tuple)
+    curried_functions: Sequence[CurriedFunctionCallMapper] = field(
+        default_factory=tuple
+    )
+    arguments: Sequence[ArgumentMapper] = field(default_factory=tuple)
+    lambdas: Sequence[LambdaMapper] = field(default_factory=tuple)
+
+    # Built once per set of rules since they are shared by all the queries
+    # on an entity.
+    column_index: _MapperIndex[ColumnMapper] = field(
+        init=False, repr=False, compare=False
+    )
+    subscriptable_index: _MapperIndex[SubscriptableReferenceMapper] = field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        # Mappers are frequently provided as lists. Store them as tuples so
+        # the rules are actually immutable and this object is hashable.
+        for f in fields(self):
+            if f.init:
+                object.__setattr__(self, f.name, tuple(getattr(self, f.name)))
+        object.__setattr__(
+            self, "column_index", _MapperIndex(self.columns, _get_column_mapper_key)
+        )
+        object.__setattr__(
+            self,
+            "subscriptable_index",
+            _MapperIndex(self.subscriptables, _get_subscriptable_mapper_key),
+        )
 
     def concat(self, spec: TranslationMappers) -> TranslationMappers:
         return TranslationMappers(
-            literals=[*self.literals, *spec.literals],
-            columns=[*self.columns, *spec.columns],
-            subscriptables=[*self.subscriptables, *spec.subscriptables],
-            functions=[*self.functions, *spec.functions],
-            curried_functions=[*self.curried_functions, *spec.curried_functions],
-            arguments=[*self.arguments, *spec.arguments],
-            lambdas=[*self.lambdas, *spec.lambdas],
+            literals=(*self.literals, *spec.literals),
+            columns=(*self.columns, *spec.columns),
+            subscriptables=(*self.subscriptables, *spec.subscriptables),
+            functions=(*self.functions, *spec.functions),
+            curried_functions=(*self.curried_functions, *spec.curried_functions),
+            arguments=(*self.arguments, *spec.arguments),
+            lambdas=(*self.lambdas, *spec.lambdas),
         )
 
 
+# The rules applied after all the custom ones to translate any expression
+# not translated by a custom rule. These are stateless so a single instance
+# is shared by all translators.
+_DEFAULT_LITERAL_MAPPER = DefaultLiteralMapper()
+_DEFAULT_COLUMN_MAPPER = DefaultColumnMapper()
+_DEFAULT_SUBSCRIPTABLE_MAPPER = DefaultSubscriptableMapper()
+_DEFAULT_FUNCTION_MAPPER = DefaultFunctionMapper()
+_DEFAULT_CURRIED_FUNCTION_MAPPER = DefaultCurriedFunctionMapper()
+_DEFAULT_ARGUMENT_MAPPER = DefaultArgumentMapper()
+_DEFAULT_LAMBDA_MAPPER = DefaultLambdaMapper()
+
+# The dispatch table mixes the mappers of every expression type, so their
+# input and output types cannot be expressed more precisely.
+_Mapper = ExpressionMapper[Any, Any, SnubaClickhouseStrictTranslator]
+
+# Expression types without children whose default rule returns the
+# expression itself.
+_LEAF_TYPES: FrozenSet[Type[Expression]] = frozenset((Literal, Column, Argument))
+
+TExp = TypeVar("TExp", bound=Expression)
+
+
 class SnubaClickhouseMappingTranslator(SnubaClickhouseStrictTranslator):
     """
     Translates a Snuba expression into an clickhouse query expression
@@ -108,73 +227,106 @@ class SnubaClickhouseMappingTranslator(SnubaClickhouseStrictTranslator):
     """
 
     def __init__(self, translation_rules: TranslationMappers) -> None:
-        default_rules = TranslationMappers(
-            literals=[DefaultLiteralMapper()],
-            columns=[DefaultColumnMapper()],
-            subscriptables=[DefaultSubscriptableMapper()],
-            functions=[DefaultFunctionMapper()],
-            curried_functions=[DefaultCurriedFunctionMapper()],
-            arguments=[DefaultArgumentMapper()],
-            lambdas=[DefaultLambdaMapper()],
+        # Dispatch table from the expression class to the custom rules and
+        # the default rule that translate it, resolved once instead of on
+        # every visited node. The default rules are not concatenated to the
+        # custom ones, they are applied when no custom rule matches.
+        self.__rules_by_type: Mapping[
+            Type[Expression], Tuple[Sequence[_Mapper], _Mapper]
+        ] = {
+            Literal: (translation_rules.literals, _DEFAULT_LITERAL_MAPPER),
+            Column: (translation_rules.columns, _DEFAULT_COLUMN_MAPPER),
+            SubscriptableReference: (
+                translation_rules.subscriptables,
+                _DEFAULT_SUBSCRIPTABLE_MAPPER,
+            ),
+            FunctionCall: (translation_rules.functions, _DEFAULT_FUNCTION_MAPPER),
+            CurriedFunctionCall: (
+                translation_rules.curried_functions,
+                _DEFAULT_CURRIED_FUNCTION_MAPPER,
+            ),
+            Argument: (translation_rules.arguments, _DEFAULT_ARGUMENT_MAPPER),
+            Lambda: (translation_rules.lambdas, _DEFAULT_LAMBDA_MAPPER),
+        }
+        self.__column_index = translation_rules.column_index
+        self.__subscriptable_index = translation_rules.subscriptable_index
+        # Leaves without any custom rule are left untouched, so they are
+        # returned as they are without going through the rules or the cache.
+        self.__untouched_types = frozenset(
+            exp_type
+            for exp_type in _LEAF_TYPES
+            if not self.__rules_by_type[exp_type][0]
         )
-        self.__translation_rules = translation_rules.concat(default_rules)
-        self.__cache: MutableMapping[Expression, Expression] = {}
+        # Translations are cached by the identity of the translated node.
+        # Hashing an expression hashes its whole subtree, which made looking
+        # up a deep tree quadratic. Entries keep a reference to the node so
+        # its id cannot be reused by another expression.
+        self.__cache: MutableMapping[int, Tuple[Expression, Expression]] = {}
+
+    def __map(self, exp: Expression) -> Expression:
+        if type(exp) in self.__untouched_types:
+            return exp
+
+        mappers, default = self.__rules_by_type[type(exp)]
+        # The mappers in the table are typed loosely, but every one of them
+        # produces an Expression.
+        return cast(Expression, apply_mappers(exp, mappers, self, default))
+
+    def __map_column(self, exp: Column) -> Expression:
+        return apply_mappers(
+            exp,
+            self.__column_index.get((exp.column_name, exp.table_name)),
+            self,
+            _DEFAULT_COLUMN_MAPPER,
+        )
+
+    def __map_subscriptable(self, exp: SubscriptableReference) -> Expression:
+        return apply_mappers(
+            exp,
+            self.__subscriptable_index.get(
+                (exp.column.column_name, exp.column.table_name)
+            ),
+            self,
+            _DEFAULT_SUBSCRIPTABLE_MAPPER,
+        )
+
+    def __map_cached(
+        self, exp: TExp, map_func: Callable[[TExp], Expression]
+    ) -> Expression:
+        if type(exp) in self.__untouched_types:
+            return exp
+        cached = self.__cache.get(id(exp))
+        if cached is not None:
+            return cached[1]
+
+        ret = map_func(exp)
+        self.__cache[id(exp)] = (exp, ret)
+        return ret
 
     def visit_literal(self, exp: Literal) -> Expression:
         # We can't use the cache for literals because Python hashes
         # Literal(None, 0) and Literal(None, 0.0) equivalently, which can then
         # break Clickhouse since it expects the correct type. This isn't a major
         # performance hit though since Literals can't contain other expressions.
-        ret = apply_mappers(exp, self.__translation_rules.literals, self)
-        return ret
+        return self.__map(exp)
 
     def visit_column(self, exp: Column) -> Expression:
-        if exp in self.__cache:
-            return self.__cache[exp]
-
-        ret = apply_mappers(exp, self.__translation_rules.columns, self)
-        self.__cache[exp] = ret
-        return ret
+        return self.__map_cached(exp, self.__map_column)
 
     def visit_subscriptable_reference(self, exp: SubscriptableReference) -> Expression:
-        if exp in self.__cache:
-            return self.__cache[exp]
-
-        ret = apply_mappers(exp, self.__translation_rules.subscriptables, self)
-        self.__cache[exp] = ret
-        return ret
+        return self.__map_cached(exp, self.__map_subscriptable)
 
     def visit_function_call(self, exp: FunctionCall) -> Expression:
-        if exp in self.__cache:
-            return self.__cache[exp]
-
-        ret = apply_mappers(exp, self.__translation_rules.functions, self)
-        self.__cache[exp] = ret
-        return ret
+        return self.__map_cached(exp, self.__map)
 
     def visit_curried_function_call(self, exp: CurriedFunctionCall) -> Expression:
-        if exp in self.__cache:
-            return self.__cache[exp]
-
-        ret = apply_mappers(exp, self.__translation_rules.curried_functions, self)
-        self.__cache[exp] = ret
-        return ret
+        return self.__map_cached(exp, self.__map)
 
     def visit_argument(self, exp: Argument) -> Expression:
-        if exp in self.__cache:
-            return self.__cache[exp]
-
-        ret = apply_mappers(exp, self.__translation_rules.arguments, self)
-        self.__cache[exp] = ret
-        return ret
+        return self.__map_cached(exp, self.__map)
 
     def visit_lambda(self, exp: Lambda) -> Expression:
-        if exp in self.__cache:
-            return self.__cache[exp]
-
-        ret = apply_mappers(exp, self.__translation_rules.lambdas, self)
-        self.__cache[exp] = ret
-        return ret
+        return self.__map_cached(exp, self.__map)
 
     def translate_function_strict(self, exp: FunctionCall) -> FunctionCall:
         """
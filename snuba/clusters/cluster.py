@@ -1,8 +1,11 @@
+import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from enum import Enum
+from types import MappingProxyType
 from typing import (
     Any,
+    FrozenSet,
     Generic,
     Mapping,
     MutableMapping,
@@ -15,7 +18,6 @@ from typing import (
 )
 
 from snuba import settings
-from snuba.clickhouse.escaping import escape_string
 from snuba.clickhouse.http import HTTPBatchWriter, InsertStatement, JSONRow
 from snuba.clickhouse.native import ClickhousePool, NativeDriverReader
 from snuba.clusters.storage_sets import DEV_STORAGE_SETS, StorageSetKey
@@ -24,6 +26,10 @@ from snuba.utils.metrics import MetricsBackend
 from snuba.writer import BatchWriter
 
 
+# How long the nodes of a ClickHouse cluster are cached for.
+NODES_CACHE_TTL_SECONDS = 60
+
+
 class ClickhouseClientSettingsType(NamedTuple):
     settings: Mapping[str, Any]
     timeout: Optional[int]
@@ -89,21 +95,18 @@ class Cluster(ABC, Generic[TWriterOptions]):
     """
 
     def __init__(self, storage_sets: Set[str]):
-        self.__storage_sets = storage_sets
-
-    def get_storage_set_keys(self) -> Set[StorageSetKey]:
         all_storage_sets = set(key.value for key in StorageSetKey)
+        # We ignore invalid storage set keys since new storage sets will
+        # need to be registered to configuration before they can be used
+        # in Snuba.
+        self.__storage_set_keys = frozenset(
+            StorageSetKey(storage_set)
+            for storage_set in storage_sets
+            if storage_set in all_storage_sets
+        )
 
-        storage_set_keys = set()
-
-        for storage_set in self.__storage_sets:
-            # We ignore invalid storage set keys since new storage sets will
-            # need to be registered to configuration before they can be used
-            # in Snuba.
-            if storage_set in all_storage_sets:
-                storage_set_keys.add(StorageSetKey(storage_set))
-
-        return storage_set_keys
+    def get_storage_set_keys(self) -> FrozenSet[StorageSetKey]:
+        return self.__storage_set_keys
 
     @abstractmethod
     def get_reader(self) -> Reader:
@@ -167,6 +170,12 @@ class ClickhouseCluster(Cluster[ClickhouseWriterOptions]):
         self.__single_node = single_node
         self.__cluster_name = cluster_name
         self.__distributed_cluster_name = distributed_cluster_name
+        self.__single_node_nodes: Sequence[ClickhouseNode] = [self.__query_node]
+        # The topology of a cluster rarely changes, so the nodes of each
+        # ClickHouse cluster are cached for a short time once queried.
+        self.__nodes_cache: MutableMapping[
+            str, Tuple[float, Sequence[ClickhouseNode]]
+        ] = {}
         self.__reader: Optional[Reader] = None
         self.__connection_cache: MutableMapping[
             Tuple[ClickhouseNode, ClickhouseClientSettings], ClickhousePool
@@ -258,7 +267,7 @@ class ClickhouseCluster(Cluster[ClickhouseWriterOptions]):
 
     def get_local_nodes(self) -> Sequence[ClickhouseNode]:
         if self.__single_node:
-            return [self.__query_node]
+            return self.__single_node_nodes
 
         assert self.__cluster_name is not None, "cluster_name must be set"
         return self.__get_cluster_nodes(self.__cluster_name)
@@ -272,14 +281,22 @@ class ClickhouseCluster(Cluster[ClickhouseWriterOptions]):
         return self.__get_cluster_nodes(self.__distributed_cluster_name)
 
     def __get_cluster_nodes(self, cluster_name: str) -> Sequence[ClickhouseNode]:
-        return [
+        now = time.time()
+        cached = self.__nodes_cache.get(cluster_name)
+        if cached is not None and cached[0] > now:
+            return cached[1]
+
+        nodes = [
             ClickhouseNode(*host)
             for host in self.get_query_connection(
                 ClickhouseClientSettings.QUERY
             ).execute(
-                f"select host_name, port, shard_num, replica_num from system.clusters where cluster={escape_string(cluster_name)}"
+                "select host_name, port, shard_num, replica_num from system.clusters where cluster = %(cluster_name)s",
+                {"cluster_name": cluster_name},
             )
         ]
+        self.__nodes_cache[cluster_name] = (now + NODES_CACHE_TTL_SECONDS, nodes)
+        return nodes
 
 
 CLUSTERS = [
@@ -300,17 +317,22 @@ CLUSTERS = [
     for cluster in settings.CLUSTERS
 ]
 
-_registered_storage_sets = [
-    storage_set
-    for cluster in CLUSTERS
-    for storage_set in cluster.get_storage_set_keys()
-]
 
-_unique_registered_storage_sets = set(_registered_storage_sets)
+def _build_storage_set_cluster_map(
+    clusters: Sequence[ClickhouseCluster],
+) -> Mapping[StorageSetKey, ClickhouseCluster]:
+    storage_set_cluster_map: MutableMapping[StorageSetKey, ClickhouseCluster] = {}
+    for cluster in clusters:
+        for storage_set in cluster.get_storage_set_keys():
+            assert (
+                storage_set not in storage_set_cluster_map
+            ), "Storage set registered to more than one cluster"
+            storage_set_cluster_map[storage_set] = cluster
+    return MappingProxyType(storage_set_cluster_map)
 
-assert len(_registered_storage_sets) == len(
-    _unique_registered_storage_sets
-), "Storage set registered to more than one cluster"
+
+# Map all storages to clusters via storage sets
+_STORAGE_SET_CLUSTER_MAP = _build_storage_set_cluster_map(CLUSTERS)
 
 expected_storage_sets = {
     s
@@ -319,16 +341,9 @@ expected_storage_sets = {
 }
 
 assert (
-    not expected_storage_sets - _unique_registered_storage_sets
+    not expected_storage_sets - _STORAGE_SET_CLUSTER_MAP.keys()
 ), "All storage sets must be assigned to a cluster"
 
-# Map all storages to clusters via storage sets
-_STORAGE_SET_CLUSTER_MAP = {
-    storage_set: cluster
-    for cluster in CLUSTERS
-    for storage_set in cluster.get_storage_set_keys()
-}
-
 
 def get_cluster(storage_set_key: StorageSetKey) -> ClickhouseCluster:
     assert (
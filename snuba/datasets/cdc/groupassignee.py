@@ -11,5 +11,7 @@ class GroupAssigneeDataset(Dataset):
     there is no issue in fixing the name.
     """
 
+    __slots__ = ()
+
     def __init__(self) -> None:
         super().__init__(default_entity=EntityKey.GROUPASSIGNEE)
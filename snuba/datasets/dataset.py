@@ -38,8 +38,13 @@ class Dataset:
     query planners, etc.). The lowest layer incldues simple objects that define
     the query itself (Query, Schema, RelationalSource). The lop layer object access and
     manipulate the lower layer objects.
+
+    Datasets are instantiated once and kept for the lifetime of the process,
+    subclasses should declare their own __slots__.
     """
 
+    __slots__ = ("__default_entity",)
+
     def __init__(self, *, default_entity: EntityKey) -> None:
         self.__default_entity = default_entity
 
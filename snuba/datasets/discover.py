@@ -26,6 +26,8 @@ EVENTS_AND_TRANSACTIONS = EntityKey.DISCOVER
 
 
 class DiscoverDataset(Dataset):
+    __slots__ = ()
+
     def __init__(self) -> None:
         super().__init__(default_entity=EntityKey.DISCOVER)
 
@@ -3,5 +3,7 @@ from snuba.datasets.entities import EntityKey
 
 
 class MetricsDataset(Dataset):
+    __slots__ = ()
+
     def __init__(self) -> None:
         super().__init__(default_entity=EntityKey.METRICS_SETS)
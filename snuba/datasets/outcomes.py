@@ -7,5 +7,7 @@ class OutcomesDataset(Dataset):
     Tracks event ingestion outcomes in Sentry.
     """
 
+    __slots__ = ()
+
     def __init__(self) -> None:
         super().__init__(default_entity=EntityKey.OUTCOMES)
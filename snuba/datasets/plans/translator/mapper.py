@@ -36,10 +36,11 @@ def apply_mappers(
     expression: TExpIn,
     mappers: Sequence[ExpressionMapper[TExpIn, TExpOut, TTranslator]],
     children_translator: TTranslator,
+    default: Optional[ExpressionMapper[TExpIn, TExpOut, TTranslator]] = None,
 ) -> TExpOut:
     """
     Applies several mappers in sequence to an expression and returns the result of the
-    first mapper that matches.
+    first mapper that matches. The default mapper, if provided, is applied last.
     If no mapper capable of translating the expression is found, this throws.
     """
 
@@ -47,4 +48,8 @@ def apply_mappers(
         ret = r.attempt_map(expression, children_translator)
         if ret is not None:
             return ret
+    if default is not None:
+        ret = default.attempt_map(expression, children_translator)
+        if ret is not None:
+            return ret
     raise ValueError(f"Cannot map expression {expression}")
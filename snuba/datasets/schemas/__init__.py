@@ -47,6 +47,8 @@ class Schema(ABC):
     class will break up into snuba schema and clickhouse schema.
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def get_data_source(self) -> RelationalSource:
         """
@@ -38,6 +38,16 @@ class TableSchema(Schema):
     a Clickhouse table, a Clickhouse view or a Materialized view.
     """
 
+    __slots__ = (
+        "__local_table_name",
+        "__dist_table_name",
+        "__storage_set_key",
+        "__columns",
+        "__mandatory_conditions",
+        "__part_format",
+        "__table_name",
+    )
+
     def __init__(
         self,
         columns: ColumnSet,
@@ -54,6 +64,8 @@ class TableSchema(Schema):
         self.__columns = columns
         self.__mandatory_conditions = mandatory_conditions
         self.__part_format = part_format
+        # Resolved lazily since resolving it requires loading the cluster.
+        self.__table_name: Optional[str] = None
 
     def get_data_source(self) -> TableSource:
         """
@@ -81,11 +93,13 @@ class TableSchema(Schema):
         This represents the table we interact with to send queries to Clickhouse.
         In distributed mode this will be a distributed table. In local mode it is a local table.
         """
-        return (
-            self.__local_table_name
-            if get_cluster(self.__storage_set_key).is_single_node()
-            else self.__dist_table_name
-        )
+        if self.__table_name is None:
+            self.__table_name = (
+                self.__local_table_name
+                if get_cluster(self.__storage_set_key).is_single_node()
+                else self.__dist_table_name
+            )
+        return self.__table_name
 
     def get_part_format(self) -> Optional[Sequence[util.PartSegment]]:
         """
@@ -102,4 +116,4 @@ class WritableTableSchema(TableSchema):
     schema from StorageSchemas.
     """
 
-    pass
+    __slots__ = ()
@@ -1,5 +1,6 @@
 import logging
 from dataclasses import replace
+from functools import lru_cache
 from typing import Optional
 
 from snuba import environment, settings
@@ -16,6 +17,18 @@ from snuba.utils.metrics.wrapper import MetricsWrapper
 logger = logging.getLogger(__name__)
 metrics = MetricsWrapper(environment.metrics, "processors.replaced_groups")
 
+# Expressions are immutable, so every exclusion condition can share this.
+ASSUME_NOT_NULL_GROUP_ID = FunctionCall(
+    None, "assumeNotNull", (Column(None, None, "group_id"),)
+)
+
+
+@lru_cache(maxsize=65536, typed=True)
+def _int_literal(value: int) -> Literal:
+    # Literals are immutable so the same instance can be shared by every
+    # query excluding the same group.
+    return Literal(None, value)
+
 
 class PostReplacementConsistencyEnforcer(QueryProcessor):
     """
@@ -61,10 +74,8 @@ class PostReplacementConsistencyEnforcer(QueryProcessor):
                 else:
                     query.add_condition_to_ast(
                         not_in_condition(
-                            FunctionCall(
-                                None, "assumeNotNull", (Column(None, None, "group_id"),)
-                            ),
-                            [Literal(None, p) for p in exclude_group_ids],
+                            ASSUME_NOT_NULL_GROUP_ID,
+                            tuple(map(_int_literal, exclude_group_ids)),
                         )
                     )
             else:
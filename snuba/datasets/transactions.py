@@ -3,5 +3,7 @@ from snuba.datasets.entities import EntityKey
 
 
 class TransactionsDataset(Dataset):
+    __slots__ = ()
+
     def __init__(self) -> None:
         super().__init__(default_entity=EntityKey.TRANSACTIONS)
@@ -7,6 +7,7 @@ from typing import (
     Callable,
     Generic,
     Iterator,
+    List,
     Optional,
     TypeVar,
     Tuple,
@@ -113,6 +114,27 @@ class ExpressionVisitor(ABC, Generic[TVisited]):
 OptionalScalarType = Union[None, bool, str, float, int, date, datetime]
 
 
+def _transform_children(
+    children: Tuple[Expression, ...], func: Callable[[Expression], Expression]
+) -> Tuple[Expression, ...]:
+    """
+    Transforms a tuple of children returning the original tuple if none of
+    them changed. A new list is only allocated when the first child changes.
+
+    Expressions are immutable, so transform only copies a node when one of
+    its children was replaced and otherwise passes the node itself to the
+    transformation function.
+    """
+    transformed: Optional[List[Expression]] = None
+    for index, child in enumerate(children):
+        new_child = child.transform(func)
+        if new_child is not child:
+            if transformed is None:
+                transformed = list(children)
+            transformed[index] = new_child
+    return children if transformed is None else tuple(transformed)
+
+
 @dataclass(frozen=True)
 class Literal(Expression):
     """
@@ -169,10 +191,11 @@ class SubscriptableReference(Expression):
         return visitor.visit_subscriptable_reference(self)
 
     def transform(self, func: Callable[[Expression], Expression]) -> Expression:
-        transformed = replace(
-            self, column=self.column.transform(func), key=self.key.transform(func),
-        )
-        return func(transformed)
+        column = self.column.transform(func)
+        key = self.key.transform(func)
+        if column is self.column and key is self.key:
+            return func(self)
+        return func(replace(self, column=column, key=key))
 
     def __iter__(self) -> Iterator[Expression]:
         # Since column is a column and key is a literal and since none of
@@ -215,11 +238,10 @@ class FunctionCall(Expression):
         transformation function and we do not run that same function over the
         new children.
         """
-        transformed = replace(
-            self,
-            parameters=tuple(map(lambda child: child.transform(func), self.parameters)),
-        )
-        return func(transformed)
+        parameters = _transform_children(self.parameters, func)
+        if parameters is self.parameters:
+            return func(self)
+        return func(replace(self, parameters=parameters))
 
     def __iter__(self) -> Iterator[Expression]:
         """
@@ -261,12 +283,16 @@ class CurriedFunctionCall(Expression):
         one transforms the internal function before applying the function to the
         parameters.
         """
-        transformed = replace(
-            self,
-            internal_function=self.internal_function.transform(func),
-            parameters=tuple(map(lambda child: child.transform(func), self.parameters)),
+        internal_function = self.internal_function.transform(func)
+        parameters = _transform_children(self.parameters, func)
+        if (
+            internal_function is self.internal_function
+            and parameters is self.parameters
+        ):
+            return func(self)
+        return func(
+            replace(self, internal_function=internal_function, parameters=parameters)
         )
-        return func(transformed)
 
     def __iter__(self) -> Iterator[Expression]:
         """
@@ -319,8 +345,10 @@ class Lambda(Expression):
         Applies the transformation to the inner expression but not to the parameters
         declaration.
         """
-        transformed = replace(self, transformation=self.transformation.transform(func))
-        return func(transformed)
+        transformation = self.transformation.transform(func)
+        if transformation is self.transformation:
+            return func(self)
+        return func(replace(self, transformation=transformation))
 
     def __iter__(self) -> Iterator[Expression]:
         """
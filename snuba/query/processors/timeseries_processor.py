@@ -14,6 +14,14 @@ from snuba.query.processors import QueryProcessor
 from snuba.request.request_settings import RequestSettings
 from snuba.util import parse_datetime
 
+# Rounding functions used to group time columns at the supported
+# granularities. Any other granularity is rounded arithmetically.
+TIME_GROUP_FUNCTIONS = {
+    3600: "toStartOfHour",
+    60: "toStartOfMinute",
+    86400: "toDate",
+}
+
 
 class TimeSeriesProcessor(QueryProcessor):
     """
@@ -105,48 +113,34 @@ class TimeSeriesProcessor(QueryProcessor):
     def __group_time_function(
         self, column_name: str, granularity: int, alias: Optional[str]
     ) -> FunctionCall:
-        function_call = {
-            3600: FunctionCall(
-                alias,
-                "toStartOfHour",
-                (Column(None, None, column_name), Literal(None, "Universal")),
-            ),
-            60: FunctionCall(
-                alias,
-                "toStartOfMinute",
-                (Column(None, None, column_name), Literal(None, "Universal")),
-            ),
-            86400: FunctionCall(
+        function_name = TIME_GROUP_FUNCTIONS.get(granularity)
+        if function_name is not None:
+            return FunctionCall(
                 alias,
-                "toDate",
+                function_name,
                 (Column(None, None, column_name), Literal(None, "Universal")),
-            ),
-        }.get(granularity)
-        if not function_call:
-            function_call = FunctionCall(
-                alias,
-                "toDateTime",
-                (
-                    multiply(
-                        FunctionCall(
-                            None,
-                            "intDiv",
-                            (
-                                FunctionCall(
-                                    None,
-                                    "toUInt32",
-                                    (Column(None, None, column_name),),
-                                ),
-                                Literal(None, granularity),
+            )
+
+        return FunctionCall(
+            alias,
+            "toDateTime",
+            (
+                multiply(
+                    FunctionCall(
+                        None,
+                        "intDiv",
+                        (
+                            FunctionCall(
+                                None, "toUInt32", (Column(None, None, column_name),),
                             ),
+                            Literal(None, granularity),
                         ),
-                        Literal(None, granularity),
                     ),
-                    Literal(None, "Universal"),
+                    Literal(None, granularity),
                 ),
-            )
-
-        return function_call
+                Literal(None, "Universal"),
+            ),
+        )
 
     def __process_condition(self, exp: Expression) -> Expression:
         result = self.condition_match.match(exp)
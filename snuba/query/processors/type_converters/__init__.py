@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
-from typing import Set
+from functools import lru_cache
+from typing import FrozenSet, Set, Tuple
 
 from snuba.clickhouse.processors import QueryProcessor
 from snuba.clickhouse.query import Query
@@ -10,7 +11,7 @@ from snuba.query.matchers import Any as AnyMatch
 from snuba.query.matchers import Column as ColumnMatch
 from snuba.query.matchers import FunctionCall as FunctionCallMatch
 from snuba.query.matchers import Literal as LiteralMatch
-from snuba.query.matchers import Or, Param, String
+from snuba.query.matchers import Or, Param, Pattern, String
 from snuba.request.request_settings import RequestSettings
 
 
@@ -18,48 +19,56 @@ class ColumnTypeError(ValidationException):
     pass
 
 
-class BaseTypeConverter(QueryProcessor, ABC):
-    def __init__(self, columns: Set[str]):
-        self.columns = columns
-        column_match = Or([String(col) for col in columns])
-
-        literal = Param("literal", LiteralMatch(AnyMatch(str)))
-
-        operator = Param(
-            "operator",
-            Or(
-                [
-                    String(op)
-                    for op in FUNCTION_TO_OPERATOR
-                    if op not in (ConditionFunctions.IN, ConditionFunctions.NOT_IN)
-                ]
-            ),
-        )
+_IN_OPERATORS = frozenset((ConditionFunctions.IN, ConditionFunctions.NOT_IN))
+# Function names the condition matchers can possibly match. Anything else
+# is skipped without running the matchers.
+_ELIGIBLE_FUNCTIONS = frozenset((*FUNCTION_TO_OPERATOR, "has"))
 
-        in_operators = Param(
-            "operator",
-            Or((String(ConditionFunctions.IN), String(ConditionFunctions.NOT_IN))),
-        )
+# The parts of the condition matchers that do not depend on the columns.
+_LITERAL_MATCH = Param("literal", LiteralMatch(AnyMatch(str)))
+_OPERATOR_MATCH = Param(
+    "operator",
+    Or([String(op) for op in FUNCTION_TO_OPERATOR if op not in _IN_OPERATORS]),
+)
+_IN_OPERATOR_MATCH = Param(
+    "operator", Or((String(ConditionFunctions.IN), String(ConditionFunctions.NOT_IN))),
+)
+_TUPLE_MATCH = Param(
+    "tuple", FunctionCallMatch(String("tuple"), all_parameters=LiteralMatch()),
+)
 
-        col = Param("col", ColumnMatch(None, column_match))
 
-        self.__condition_matcher = Or(
-            [
-                FunctionCallMatch(operator, (literal, col)),
-                FunctionCallMatch(operator, (col, literal)),
-                FunctionCallMatch(Param("operator", String("has")), (col, literal)),
-            ]
-        )
+@lru_cache(maxsize=None)
+def _build_matchers(
+    columns: FrozenSet[str],
+) -> Tuple[Pattern[FunctionCall], Pattern[FunctionCall]]:
+    """
+    Builds the condition matchers for a set of columns. Matchers are
+    immutable, so processors converting the same columns share them
+    instead of building their own.
+    """
+    column_match = Or([String(col) for col in columns])
 
-        self.__in_condition_matcher = FunctionCallMatch(
-            in_operators,
-            (
-                col,
-                Param(
-                    "tuple",
-                    FunctionCallMatch(String("tuple"), all_parameters=LiteralMatch()),
-                ),
-            ),
+    col = Param("col", ColumnMatch(None, column_match))
+
+    condition_matcher = Or(
+        [
+            FunctionCallMatch(_OPERATOR_MATCH, (_LITERAL_MATCH, col)),
+            FunctionCallMatch(_OPERATOR_MATCH, (col, _LITERAL_MATCH)),
+            FunctionCallMatch(Param("operator", String("has")), (col, _LITERAL_MATCH)),
+        ]
+    )
+
+    in_condition_matcher = FunctionCallMatch(_IN_OPERATOR_MATCH, (col, _TUPLE_MATCH))
+
+    return condition_matcher, in_condition_matcher
+
+
+class BaseTypeConverter(QueryProcessor, ABC):
+    def __init__(self, columns: Set[str]):
+        self.columns = columns
+        self.__condition_matcher, self.__in_condition_matcher = _build_matchers(
+            frozenset(columns)
         )
 
     def process_query(self, query: Query, request_settings: RequestSettings) -> None:
@@ -86,8 +95,26 @@ class BaseTypeConverter(QueryProcessor, ABC):
             assert isinstance(lit, Literal)
             return lit
 
-        match = self.__condition_matcher.match(exp)
-        if match is not None:
+        if (
+            not isinstance(exp, FunctionCall)
+            or exp.function_name not in _ELIGIBLE_FUNCTIONS
+        ):
+            return exp
+
+        # Every pattern requires one of the converted columns as a direct
+        # parameter of the function. Checking for it is much cheaper than
+        # running the matchers and rules out most conditions.
+        if not any(
+            isinstance(param, Column) and param.column_name in self.columns
+            for param in exp.parameters
+        ):
+            return exp
+
+        if exp.function_name not in _IN_OPERATORS:
+            match = self.__condition_matcher.match(exp)
+            if match is None:
+                return exp
+
             return FunctionCall(
                 exp.alias,
                 match.string("operator"),
@@ -1,5 +1,3 @@
-import uuid
-
 from snuba.query.expressions import (
     Argument,
     Column,
@@ -9,16 +7,15 @@ from snuba.query.expressions import (
     Literal,
 )
 from snuba.query.processors.type_converters import BaseTypeConverter, ColumnTypeError
+from snuba.query.processors.type_converters.uuid_column_processor import canonical_uuid
 
 
 class UUIDArrayColumnProcessor(BaseTypeConverter):
     def _translate_literal(self, exp: Literal) -> Expression:
-        try:
-            assert isinstance(exp.value, str)
-            new_val = str(uuid.UUID(exp.value))
-            return FunctionCall(exp.alias, "toUUID", (Literal(None, value=new_val),))
-        except (AssertionError, ValueError):
+        new_val = canonical_uuid(exp.value) if isinstance(exp.value, str) else None
+        if new_val is None:
             raise ColumnTypeError("Not a valid UUID string", report=False)
+        return FunctionCall(exp.alias, "toUUID", (Literal(None, value=new_val),))
 
     def _process_expressions(self, exp: Expression) -> Expression:
         if isinstance(exp, Column) and exp.column_name in self.columns:
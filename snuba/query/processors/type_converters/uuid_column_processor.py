@@ -1,17 +1,45 @@
+import re
 import uuid
+from functools import lru_cache
+from typing import Optional
 
 from snuba.query.expressions import Column, Expression, FunctionCall, Literal
 from snuba.query.processors.type_converters import BaseTypeConverter, ColumnTypeError
 
 
+CANONICAL_UUID_RE = re.compile(
+    r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}"
+)
+
+
+def canonical_uuid(value: str) -> Optional[str]:
+    """
+    Returns the canonical string representation of a UUID or None if the
+    value is not a valid UUID.
+    """
+    # Most UUIDs are already provided in the canonical form, which does
+    # not need to be parsed at all.
+    if len(value) == 36 and CANONICAL_UUID_RE.fullmatch(value):
+        return value
+    return _parse_uuid(value)
+
+
+@lru_cache(maxsize=4096)
+def _parse_uuid(value: str) -> Optional[str]:
+    # The same literals tend to show up across many queries, so the parsed
+    # result is cached.
+    try:
+        return str(uuid.UUID(value))
+    except ValueError:
+        return None
+
+
 class UUIDColumnProcessor(BaseTypeConverter):
     def _translate_literal(self, exp: Literal) -> Literal:
-        try:
-            assert isinstance(exp.value, str)
-            new_val = str(uuid.UUID(exp.value))
-            return Literal(alias=exp.alias, value=new_val)
-        except (AssertionError, ValueError):
+        new_val = canonical_uuid(exp.value) if isinstance(exp.value, str) else None
+        if new_val is None:
             raise ColumnTypeError("Not a valid UUID string", report=False)
+        return Literal(alias=exp.alias, value=new_val)
 
     def _process_expressions(self, exp: Expression) -> Expression:
         if isinstance(exp, Column) and exp.column_name in self.columns:
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from enum import Enum
-from typing import Any, Mapping, Union
+from typing import Any, Mapping, Tuple, Union
 
 from snuba.query.logical import Query
 from snuba.query.composite import CompositeQuery
@@ -21,8 +21,22 @@ class Language(Enum):
 
 @dataclass(frozen=True)
 class Request:
+    # A Request is built for every query, slots avoid allocating an
+    # instance dict for each of them. Declared by hand as dataclass only
+    # generates them from Python 3.10.
+    __slots__ = ("id", "body", "query", "settings", "referrer")
+
     id: str
     body: Mapping[str, Any]
     query: Union[Query, CompositeQuery[Entity]]
     settings: RequestSettings  # settings provided by the request
     referrer: str
+
+    # Copying and pickling restore the slots through setattr, which the
+    # frozen dataclass forbids, so the state is restored explicitly.
+    def __getstate__(self) -> Tuple[Any, ...]:
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __setstate__(self, state: Tuple[Any, ...]) -> None:
+        for name, value in zip(self.__slots__, state):
+            object.__setattr__(self, name, value)
@@ -1,13 +1,16 @@
 from __future__ import annotations
 
-import itertools
-from typing import Any, Mapping, MutableMapping, NamedTuple, Type
+import copy
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, List, Mapping, MutableMapping, NamedTuple, Optional, Tuple, Type
 
 import jsonschema
 import sentry_sdk
 
 from snuba import environment
 from snuba.datasets.entities.factory import get_entity
+from snuba.datasets.entity import Entity
 from snuba.query.extensions import QueryExtension
 from snuba.query.logical import Query
 from snuba.query.schema import GENERIC_QUERY_SCHEMA, SNQL_QUERY_SCHEMA
@@ -18,16 +21,22 @@ from snuba.request.request_settings import (
     RequestSettings,
     SubscriptionRequestSettings,
 )
-from snuba.schemas import Schema, validate_jsonschema
+from snuba.schemas import Schema, build_validator
 from snuba.utils.metrics.wrapper import MetricsWrapper
 
 metrics = MetricsWrapper(environment.metrics, "parser")
 
+_EMPTY_BODY: Mapping[str, Any] = MappingProxyType({})
+# Index of the settings in the parts a request is split into.
+_SETTINGS_PART = 1
+
 
 class RequestParts(NamedTuple):
     query: Mapping[str, Any]
     settings: Mapping[str, Any]
     extensions: Mapping[str, Any]
+    # The query and the extensions merged together, without the settings.
+    body: Mapping[str, Any]
 
 
 class RequestSchema:
@@ -53,9 +62,10 @@ class RequestSchema:
         }
         self.__setting_class = settings_class
 
-        for schema in itertools.chain(
-            [self.__query_schema, self.__settings_schema],
-            self.__extension_schemas.values(),
+        for schema in (
+            self.__query_schema,
+            self.__settings_schema,
+            *self.__extension_schemas.values(),
         ):
             assert schema["type"] == "object", "subschema must be object"
             assert (
@@ -63,23 +73,38 @@ class RequestSchema:
             ), "subschema must not allow additional properties"
             self.__composite_schema["required"].extend(schema.get("required", []))
 
-            for property_name, property_schema in schema["properties"].items():
-                assert (
-                    property_name not in self.__composite_schema["properties"]
-                ), "subschema cannot redefine property"
-                self.__composite_schema["properties"][property_name] = property_schema
+            properties = schema["properties"]
+            assert not (
+                self.__composite_schema["properties"].keys() & properties.keys()
+            ), "subschema cannot redefine property"
+            self.__composite_schema["properties"].update(properties)
 
-            for definition_name, definition_schema in schema.get(
-                "definitions", {}
-            ).items():
-                assert (
-                    definition_name not in self.__composite_schema["definitions"]
-                ), "subschema cannot redefine definition"
-                self.__composite_schema["definitions"][
-                    definition_name
-                ] = definition_schema
+            definitions = schema.get("definitions", {})
+            assert not (
+                self.__composite_schema["definitions"].keys() & definitions.keys()
+            ), "subschema cannot redefine definition"
+            self.__composite_schema["definitions"].update(definitions)
 
-        self.__composite_schema["required"] = set(self.__composite_schema["required"])
+        self.__composite_schema["required"] = sorted(
+            set(self.__composite_schema["required"])
+        )
+        self.__validator = build_validator(self.__composite_schema)
+
+        # Maps every property to the index of the request part it belongs
+        # to: the query, the settings and then each extension in order. This
+        # is used to split a validated request in a single pass.
+        self.__key_to_part: Mapping[str, int] = {
+            key: index
+            for index, schema in enumerate(
+                [
+                    self.__query_schema,
+                    self.__settings_schema,
+                    *self.__extension_schemas.values(),
+                ]
+            )
+            for key in schema["properties"].keys()
+        }
+        self.__parts_count = 2 + len(self.__extension_schemas)
 
     @classmethod
     def build_with_extensions(
@@ -109,55 +134,114 @@ class RequestSchema:
 
     def validate(self, value: MutableMapping[str, Any]) -> RequestParts:
         try:
-            value = validate_jsonschema(value, self.__composite_schema)
+            value = self.__validator(value)
         except jsonschema.ValidationError as error:
             raise JsonSchemaValidationException(str(error)) from error
 
-        query_body = {
-            key: value.pop(key)
-            for key in self.__query_schema["properties"].keys()
-            if key in value
-        }
-        settings = {
-            key: value.pop(key)
-            for key in self.__settings_schema["properties"].keys()
-            if key in value
-        }
+        # Parts are only allocated when they receive a property, extensions
+        # without any property share the same empty body. The schema does not
+        # allow parts to share keys, so the request body is built in the same
+        # pass.
+        parts: List[Optional[MutableMapping[str, Any]]] = [None] * self.__parts_count
+        body: MutableMapping[str, Any] = {}
+        for key, property_value in value.items():
+            index = self.__key_to_part[key]
+            if index != _SETTINGS_PART:
+                body[key] = property_value
+            part = parts[index]
+            if part is None:
+                part = parts[index] = {}
+            part[key] = property_value
 
-        extensions = {}
-        for extension_name, extension_schema in self.__extension_schemas.items():
-            extensions[extension_name] = {
-                key: value.pop(key)
-                for key in extension_schema["properties"].keys()
-                if key in value
-            }
+        query_body, settings, *extension_bodies = parts
+        extensions = {
+            name: extension_body if extension_body is not None else _EMPTY_BODY
+            for name, extension_body in zip(
+                self.__extension_schemas.keys(), extension_bodies
+            )
+        }
 
-        return RequestParts(query=query_body, settings=settings, extensions=extensions)
+        return RequestParts(
+            query=query_body if query_body is not None else {},
+            settings=settings if settings is not None else {},
+            extensions=extensions,
+            body=body,
+        )
 
     def __generate_template_impl(self, schema: Mapping[str, Any]) -> Any:
         """
         Generate a (not necessarily valid) object that can be used as a template
         from the provided schema
+
+        The schema is walked depth first with an explicit stack: each entry
+        holds the container the template of a subschema is written into.
+        Objects are added to their container before their properties are
+        filled, so a subschema is complete once everything pushed after it
+        has been popped. This allows subschemas shared by multiple
+        properties to be walked only once, the cache is keyed by the
+        identity of the subschema.
         """
-        typ = schema.get("type")
-        if "default" in schema:
-            default = schema["default"]
-            return default() if callable(default) else default
-        elif typ == "object":
-            return {
-                prop: self.__generate_template_impl(subschema)
-                for prop, subschema in schema.get("properties", {}).items()
-            }
-        elif typ == "array":
-            return []
-        elif typ == "string":
-            return ""
-        return None
+        cache: MutableMapping[int, Any] = {}
+        root: MutableMapping[str, Any] = {}
+        stack: List[Tuple[MutableMapping[str, Any], str, Mapping[str, Any]]] = [
+            (root, "", schema)
+        ]
+        while stack:
+            container, prop, subschema = stack.pop()
+            key = id(subschema)
+            if key in cache:
+                cached = cache[key]
+                container[prop] = (
+                    copy.deepcopy(cached)
+                    if isinstance(cached, (dict, list))
+                    else cached
+                )
+                continue
+
+            typ = subschema.get("type")
+            template: Any = None
+            if "default" in subschema:
+                default = subschema["default"]
+                template = default() if callable(default) else default
+            elif typ == "object":
+                properties = subschema.get("properties", {})
+                # Preallocate the keys to preserve the order of the properties.
+                template = dict.fromkeys(properties)
+                stack.extend(
+                    (template, child_prop, child_schema)
+                    for child_prop, child_schema in reversed(properties.items())
+                )
+            elif typ == "array":
+                template = []
+            elif typ == "string":
+                template = ""
+
+            cache[key] = template
+            container[prop] = template
+
+        return root[""]
 
     def generate_template(self) -> Any:
         return self.__generate_template_impl(self.__composite_schema)
 
 
+@lru_cache(maxsize=None)
+def get_request_schema(
+    entity: Entity, settings_class: Type[RequestSettings], language: Language,
+) -> RequestSchema:
+    """
+    Returns the RequestSchema to validate requests on the entity.
+
+    Building a RequestSchema merges all the subschemas and builds their
+    validator, while the result only depends on the entity extensions, the
+    settings class and the language. Entities are instantiated once, so
+    the schema is only built once per process instead of once per request.
+    """
+    return RequestSchema.build_with_extensions(
+        entity.get_extensions(), settings_class, language
+    )
+
+
 SETTINGS_SCHEMAS: Mapping[Type[RequestSettings], Schema] = {
     HTTPRequestSettings: {
         "type": "object",
@@ -1,6 +1,6 @@
 import random
 import uuid
-from typing import Any, Callable, ChainMap, MutableMapping, Sequence, Type, Union
+from typing import Any, Callable, MutableMapping, Sequence, Type, Union
 
 import sentry_sdk
 
@@ -93,7 +93,7 @@ def build_request(
                 # TODO: Replace this with the actual query raw body.
                 # this can have an impact on subscriptions so we need
                 # to be careful with the change.
-                ChainMap(request_parts.query, *request_parts.extensions.values()),
+                request_parts.body,
                 query,
                 settings_obj,
                 referrer,
@@ -1,11 +1,72 @@
 import copy
-from typing import Any, Generator, Mapping, MutableMapping
+from typing import Any, Callable, Generator, Mapping, MutableMapping
 
 import jsonschema
 
 
 Schema = Mapping[str, Any]  # placeholder for JSON schema
 
+Validator = Callable[[MutableMapping[str, Any]], MutableMapping[str, Any]]
+
+_validate_properties = jsonschema.Draft6Validator.VALIDATORS["properties"]
+
+
+def _validate_and_default(
+    validator: object,
+    properties: Mapping[str, Any],
+    instance: MutableMapping[str, Any],
+    schema: Mapping[str, Any],
+) -> Generator[Exception, None, None]:
+    for property, subschema in properties.items():
+        if property not in instance and "default" in subschema:
+            if callable(subschema["default"]):
+                default_value = subschema["default"]()
+            else:
+                default_value = copy.deepcopy(subschema["default"])
+            instance[property] = default_value
+
+    for error in _validate_properties(validator, properties, instance, schema):
+        yield error
+
+
+# Creating a validator class is expensive, so the one that sets defaults is
+# only created once.
+_DefaultingValidator = jsonschema.validators.extend(
+    jsonschema.Draft4Validator, {"properties": _validate_and_default}
+)
+
+
+def build_validator(
+    schema: MutableMapping[str, Any], set_defaults: bool = True,
+) -> Validator:
+    """
+    Builds a function that validates a value against the provided schema,
+    returning the validated value if the value conforms to the schema,
+    otherwise raising a ``jsonschema.ValidationError``.
+
+    This should be preferred to validate_jsonschema when the same schema
+    is used to validate many values, since the schema validator is only
+    built once.
+    """
+    validator_cls = _DefaultingValidator if set_defaults else jsonschema.Draft6Validator
+    validator = validator_cls(
+        schema,
+        types={"array": (list, tuple)},
+        format_checker=jsonschema.FormatChecker(),
+    )
+
+    def validate(value: MutableMapping[str, Any]) -> MutableMapping[str, Any]:
+        # Using schema defaults during validation will cause the input value to be
+        # mutated, so to be on the safe side we create a deep copy of that value to
+        # avoid unwanted side effects for the calling function.
+        if set_defaults:
+            value = copy.deepcopy(value)
+
+        validator.validate(value, schema)
+        return value
+
+    return validate
+
 
 def validate_jsonschema(
     value: MutableMapping[str, Any],
@@ -17,43 +78,4 @@ def validate_jsonschema(
     value if the value conforms to the schema, otherwise raising a
     ``jsonschema.ValidationError``.
     """
-    orig = jsonschema.Draft6Validator.VALIDATORS["properties"]
-
-    def validate_and_default(
-        validator: object,
-        properties: Mapping[str, Any],
-        instance: MutableMapping[str, Any],
-        schema: Mapping[str, Any],
-    ) -> Generator[Exception, None, None]:
-        for property, subschema in properties.items():
-            if property not in instance and "default" in subschema:
-                if callable(subschema["default"]):
-                    default_value = subschema["default"]()
-                else:
-                    default_value = copy.deepcopy(subschema["default"])
-                instance[property] = default_value
-
-        for error in orig(validator, properties, instance, schema):
-            yield error
-
-    # Using schema defaults during validation will cause the input value to be
-    # mutated, so to be on the safe side we create a deep copy of that value to
-    # avoid unwanted side effects for the calling function.
-    if set_defaults:
-        value = copy.deepcopy(value)
-
-    validator_cls = (
-        jsonschema.validators.extend(
-            jsonschema.Draft4Validator, {"properties": validate_and_default}
-        )
-        if set_defaults
-        else jsonschema.Draft6Validator
-    )
-
-    validator_cls(
-        schema,
-        types={"array": (list, tuple)},
-        format_checker=jsonschema.FormatChecker(),
-    ).validate(value, schema)
-
-    return value
+    return build_validator(schema, set_defaults)(value)
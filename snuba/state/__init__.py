@@ -160,14 +160,17 @@ def set_configs(
 
 
 def get_config(key: str, default: Optional[Any] = None) -> Optional[Any]:
-    return get_all_configs().get(key, default)
+    # The raw configs are memoized, only resolve the A/B test value of the
+    # requested key instead of the ones of all configs.
+    raw_configs = get_raw_configs()
+    return abtest(raw_configs[key]) if key in raw_configs else default
 
 
 def get_configs(
     key_defaults: Iterable[Tuple[str, Optional[Any]]]
 ) -> Sequence[Optional[Any]]:
-    all_confs = get_all_configs()
-    return [all_confs.get(k, d) for k, d in key_defaults]
+    raw_configs = get_raw_configs()
+    return [abtest(raw_configs[k]) if k in raw_configs else d for k, d in key_defaults]
 
 
 def get_all_configs() -> Mapping[str, Optional[Any]]:
@@ -1,5 +1,6 @@
 import json
 
+import rapidjson
 from arroyo.backends.kafka import KafkaPayload
 
 from snuba.query.exceptions import InvalidQueryException
@@ -42,7 +43,7 @@ class SubscriptionTaskResultEncoder(Encoder[KafkaPayload, SubscriptionTaskResult
         request, result = value.result
         return KafkaPayload(
             subscription_id.encode("utf-8"),
-            json.dumps(
+            rapidjson.dumps(
                 {
                     "version": 2,
                     "payload": {
@@ -51,7 +52,10 @@ class SubscriptionTaskResultEncoder(Encoder[KafkaPayload, SubscriptionTaskResult
                         "result": result,
                         "timestamp": value.task.timestamp.isoformat(),
                     },
-                }
+                },
+                # Results may contain NaN values, which the standard library
+                # encoder allows by default.
+                number_mode=rapidjson.NM_NAN,
             ).encode("utf-8"),
             [],
         )
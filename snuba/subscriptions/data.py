@@ -41,7 +41,7 @@ from snuba.query.validation.validators import (
 )
 from snuba.request import Language, Request
 from snuba.request.request_settings import SubscriptionRequestSettings
-from snuba.request.schema import RequestSchema
+from snuba.request.schema import get_request_schema
 from snuba.request.validation import build_request, parse_legacy_query, parse_snql_query
 from snuba.utils.metrics import MetricsBackend
 from snuba.utils.metrics.timer import Timer
@@ -154,10 +154,8 @@ class LegacySubscriptionData(SubscriptionData):
         :param timestamp: Date that the query should run up until
         :param offset: Maximum offset we should query for
         """
-        schema = RequestSchema.build_with_extensions(
-            dataset.get_default_entity().get_extensions(),
-            SubscriptionRequestSettings,
-            Language.LEGACY,
+        schema = get_request_schema(
+            dataset.get_default_entity(), SubscriptionRequestSettings, Language.LEGACY,
         )
         extra_conditions: Sequence[Condition] = []
         if offset is not None:
@@ -283,8 +281,8 @@ class SnQLSubscriptionData(SubscriptionData):
         timer: Timer,
         metrics: Optional[MetricsBackend] = None,
     ) -> Request:
-        schema = RequestSchema.build_with_extensions(
-            {}, SubscriptionRequestSettings, Language.SNQL,
+        schema = get_request_schema(
+            dataset.get_default_entity(), SubscriptionRequestSettings, Language.SNQL,
         )
 
         request = build_request(
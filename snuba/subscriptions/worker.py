@@ -249,21 +249,23 @@ class SubscriptionWorker(
         self, batch: Sequence[Sequence[SubscriptionTaskResultFuture]]
     ) -> None:
         # Map over the batch, converting the ``SubscriptionResultFuture`` to a
-        # ``SubscriptionResult``. This will block and wait for any unfinished
-        # queries to complete, and raise any exceptions encountered during
-        # query execution. Either the entire batch succeeds, or the entire
-        # batch fails.
-        results = [
-            SubscriptionTaskResult(task, future.result())
+        # ``SubscriptionResult`` and producing it as soon as its query has
+        # completed, rather than waiting for every query in the batch first.
+        # This allows the results of the earlier queries to be produced while
+        # the later queries are still executing. Results are still produced in
+        # the order they were scheduled. Any exception encountered during
+        # query execution is raised, causing the batch to be replayed (the
+        # results that were already produced will be produced again.)
+        produce_futures = [
+            self.__producer.produce(
+                self.__topic, SubscriptionTaskResult(task, future.result())
+            )
             for task, future in itertools.chain.from_iterable(batch)
         ]
 
-        # Produce all of the subscription results asynchronously and wait for
-        # them to complete. Again, either the entire batch succeeds, or the
-        # entire batch fails.
-        for future in as_completed(
-            [self.__producer.produce(self.__topic, result) for result in results]
-        ):
+        # Wait for all of the subscription results to be produced. Either the
+        # entire batch succeeds, or the entire batch fails.
+        for future in as_completed(produce_futures):
             future.result()
 
 
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
-from concurrent.futures import Future
-from typing import Union
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Optional, Union
 
 from arroyo import Message, Partition, Topic
 from arroyo.backends.abstract import Producer
@@ -10,18 +10,32 @@ from snuba.utils.codecs import Encoder, TDecoded, TEncoded
 
 
 class ProducerEncodingWrapper(Producer[TDecoded]):
+    """
+    Wraps a producer, encoding payloads before they are produced.
+
+    If an executor is provided, payloads are encoded (and handed to the
+    wrapped producer) on the executor rather than on the calling thread, so
+    the caller is not blocked on encoding. Payloads are produced in the order
+    they are submitted as long as the executor only has a single worker. The
+    executor is owned by the wrapper and is shut down when it is closed.
+    """
+
     def __init__(
-        self, producer: Producer[TEncoded], encoder: Encoder[TEncoded, TDecoded]
+        self,
+        producer: Producer[TEncoded],
+        encoder: Encoder[TEncoded, TDecoded],
+        executor: Optional[ThreadPoolExecutor] = None,
     ) -> None:
         self.__producer = producer
         self.__encoder = encoder
+        self.__executor = executor
 
-    def produce(
-        self, destination: Union[Topic, Partition], payload: TDecoded
-    ) -> Future[Message[TDecoded]]:
-        decoded_future: Future[Message[TDecoded]] = Future()
-        decoded_future.set_running_or_notify_cancel()
-
+    def __produce(
+        self,
+        destination: Union[Topic, Partition],
+        payload: TDecoded,
+        decoded_future: Future[Message[TDecoded]],
+    ) -> None:
         def set_decoded_future_result(
             encoded_future: Future[Message[TEncoded]],
         ) -> None:
@@ -44,7 +58,29 @@ class ProducerEncodingWrapper(Producer[TDecoded]):
             destination, self.__encoder.encode(payload)
         ).add_done_callback(set_decoded_future_result)
 
+    def produce(
+        self, destination: Union[Topic, Partition], payload: TDecoded
+    ) -> Future[Message[TDecoded]]:
+        decoded_future: Future[Message[TDecoded]] = Future()
+        decoded_future.set_running_or_notify_cancel()
+
+        if self.__executor is None:
+            self.__produce(destination, payload, decoded_future)
+            return decoded_future
+
+        def produce_in_background() -> None:
+            try:
+                self.__produce(destination, payload, decoded_future)
+            except Exception as e:
+                decoded_future.set_exception(e)
+
+        self.__executor.submit(produce_in_background)
+
         return decoded_future
 
     def close(self) -> Future[None]:
+        if self.__executor is not None:
+            # Wait for any pending payloads to be handed to the producer
+            # before closing it.
+            self.__executor.shutdown(wait=True)
         return self.__producer.close()
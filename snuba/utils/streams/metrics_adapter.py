@@ -6,19 +6,23 @@ from snuba.utils.metrics.types import Tags
 
 class StreamMetricsAdapter:
     def __init__(self, metrics: MetricsBackend) -> None:
-        self.__wrapper = metrics
+        # The adapter is called from the stream processing loop, so the
+        # backend methods are bound once here rather than on every call.
+        self.__increment = metrics.increment
+        self.__gauge = metrics.gauge
+        self.__timing = metrics.timing
 
     def increment(
         self, name: str, value: Union[int, float] = 1, tags: Optional[Tags] = None
     ) -> None:
-        self.__wrapper.increment(name, value, tags)
+        self.__increment(name, value, tags)
 
     def gauge(
         self, name: str, value: Union[int, float], tags: Optional[Tags] = None
     ) -> None:
-        self.__wrapper.gauge(name, value, tags)
+        self.__gauge(name, value, tags)
 
     def timing(
         self, name: str, value: Union[int, float], tags: Optional[Tags] = None
     ) -> None:
-        self.__wrapper.timing(name, value, tags)
+        self.__timing(name, value, tags)
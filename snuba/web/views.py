@@ -52,7 +52,7 @@ from snuba.redis import redis_client
 from snuba.request import Language
 from snuba.request.exceptions import InvalidJsonRequestException, JsonDecodeException
 from snuba.request.request_settings import HTTPRequestSettings, RequestSettings
-from snuba.request.schema import RequestParts, RequestSchema
+from snuba.request.schema import RequestParts, get_request_schema
 from snuba.request.validation import build_request, parse_legacy_query, parse_snql_query
 from snuba.state.rate_limit import RateLimitExceeded
 from snuba.subscriptions.codecs import SubscriptionDataCodec
@@ -354,10 +354,8 @@ def unqualified_query_view(*, timer: Timer) -> WerkzeugResponse:
 @util.time_request("query")
 def dataset_query_view(*, dataset: Dataset, timer: Timer) -> Union[Response, str]:
     if http_request.method == "GET":
-        schema = RequestSchema.build_with_extensions(
-            dataset.get_default_entity().get_extensions(),
-            HTTPRequestSettings,
-            Language.LEGACY,
+        schema = get_request_schema(
+            dataset.get_default_entity(), HTTPRequestSettings, Language.LEGACY
         )
         return render_template(
             "query.html",
@@ -375,8 +373,9 @@ def dataset_query_view(*, dataset: Dataset, timer: Timer) -> Union[Response, str
 @util.time_request("snql")
 def snql_dataset_query_view(*, dataset: Dataset, timer: Timer) -> Union[Response, str]:
     if http_request.method == "GET":
-        schema = RequestSchema.build_with_extensions(
-            {}, HTTPRequestSettings, Language.SNQL,
+        # SnQL schemas do not include the entity extensions.
+        schema = get_request_schema(
+            dataset.get_default_entity(), HTTPRequestSettings, Language.SNQL
         )
         return render_template(
             "query.html",
@@ -407,8 +406,8 @@ def dataset_query(
         parser = parse_legacy_query
 
     with sentry_sdk.start_span(description="build_schema", op="validate"):
-        schema = RequestSchema.build_with_extensions(
-            dataset.get_default_entity().get_extensions(), HTTPRequestSettings, language
+        schema = get_request_schema(
+            dataset.get_default_entity(), HTTPRequestSettings, language
         )
 
     request = build_request(
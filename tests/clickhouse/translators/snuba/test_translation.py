@@ -1,6 +1,10 @@
+from typing import Optional
+
 import pytest
 
 from snuba.clickhouse.query import Expression as ClickhouseExpression
+from snuba.clickhouse.translators.snuba import SnubaClickhouseStrictTranslator
+from snuba.clickhouse.translators.snuba.allowed import ColumnMapper
 from snuba.clickhouse.translators.snuba.mappers import (
     ColumnToColumn,
     ColumnToCurriedFunction,
@@ -289,3 +293,71 @@ def test_translation(
     translated = expression.accept(translator)
 
     assert translated == expected
+
+
+def test_unchanged_expressions_are_not_copied() -> None:
+    expression = FunctionCall(
+        "f",
+        "f",
+        (
+            Column(None, None, "col"),
+            SubscriptableReference(
+                None, Column(None, None, "tags"), Literal(None, "key")
+            ),
+        ),
+    )
+    translated = expression.accept(
+        SnubaClickhouseMappingTranslator(TranslationMappers())
+    )
+    assert translated is expression
+
+
+def test_translation_mappers_are_immutable() -> None:
+    mappers = TranslationMappers(
+        columns=[ColumnToColumn(None, "col", None, "col2")]
+    ).concat(TranslationMappers(columns=[ColumnToColumn(None, "col3", None, "col4")]))
+
+    assert mappers.columns == (
+        ColumnToColumn(None, "col", None, "col2"),
+        ColumnToColumn(None, "col3", None, "col4"),
+    )
+    assert mappers.literals == ()
+    assert hash(mappers) == hash(
+        TranslationMappers(
+            columns=(
+                ColumnToColumn(None, "col", None, "col2"),
+                ColumnToColumn(None, "col3", None, "col4"),
+            )
+        )
+    )
+
+
+def test_indexed_column_mappers_preserve_order() -> None:
+    class AnyColumnToLiteral(ColumnMapper):
+        def attempt_map(
+            self,
+            expression: Column,
+            children_translator: SnubaClickhouseStrictTranslator,
+        ) -> Optional[Literal]:
+            if expression.column_name.startswith("null_"):
+                return Literal(expression.alias, None)
+            return None
+
+    translator = SnubaClickhouseMappingTranslator(
+        TranslationMappers(
+            columns=[
+                ColumnToColumn(None, "col", None, "col2"),
+                AnyColumnToLiteral(),
+                ColumnToColumn(None, "col", None, "col3"),
+                ColumnToColumn(None, "null_col", None, "col4"),
+                ColumnToColumn("table", "col", "table", "col5"),
+            ]
+        )
+    )
+
+    assert Column(None, None, "col").accept(translator) == Column(None, None, "col2")
+    assert Column(None, None, "null_col").accept(translator) == Literal(None, None)
+    assert Column(None, "table", "col").accept(translator) == Column(
+        None, "table", "col5"
+    )
+    assert Column(None, None, "other").accept(translator) == Column(None, None, "other")
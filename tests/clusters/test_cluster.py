@@ -1,4 +1,5 @@
 import importlib
+import time
 from unittest.mock import patch
 
 import pytest
@@ -152,3 +153,22 @@ def test_cache_connections() -> None:
         cluster.ClickhouseClientSettings.OPTIMIZE,
         cluster.ClickhouseNode("localhost", 8002),
     )
+
+
+@patch("snuba.settings.CLUSTERS", FULL_CONFIG)
+def test_cache_cluster_nodes() -> None:
+    importlib.reload(cluster)
+    with patch.object(ClickhousePool, "execute") as execute:
+        execute.return_value = [
+            ("host_1", 9000, 1, 1),
+            ("host_2", 9000, 2, 1),
+        ]
+
+        distributed_cluster = get_storage(StorageKey("transactions")).get_cluster()
+        nodes = distributed_cluster.get_local_nodes()
+        assert distributed_cluster.get_local_nodes() == nodes
+        assert execute.call_count == 1
+
+        with patch("time.time", return_value=time.time() + 61):
+            distributed_cluster.get_local_nodes()
+        assert execute.call_count == 2
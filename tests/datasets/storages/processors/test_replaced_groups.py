@@ -111,3 +111,16 @@ def test_too_many_groups_to_exclude(query: ClickhouseQuery) -> None:
 
     assert query.get_condition() == build_in("project_id", [2])
     assert query.get_from_clause().final
+
+
+def test_without_project_condition() -> None:
+    condition = build_in("organization_id", [2])
+    query = ClickhouseQuery(Table("my_table", ColumnSet([])), condition=condition)
+    set_project_needs_final(2, ReplacerState.EVENTS)
+
+    PostReplacementConsistencyEnforcer(
+        "project_id", ReplacerState.EVENTS
+    ).process_query(query, HTTPRequestSettings())
+
+    assert query.get_condition() == condition
+    assert not query.get_from_clause().final
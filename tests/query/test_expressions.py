@@ -174,6 +174,57 @@ def test_subscriptable() -> None:
     assert list(replaced) == [c1, l2, SubscriptableReference("alias", c1, l2)]
 
 
+def test_transform_unchanged_is_not_copied() -> None:
+    """
+    Transforming a tree without changing any node returns the same objects.
+    When a nested node changes only its ancestors are copied.
+    """
+    c1 = Column(None, "t1", "c1")
+    f1 = FunctionCall(None, "f1", (c1, Literal(None, 1)))
+    f2 = CurriedFunctionCall(None, f1, (Column(None, "t1", "c2"),))
+    lm = Lambda(None, ("x",), FunctionCall(None, "f3", (Argument(None, "x"),)))
+    s = SubscriptableReference(None, Column(None, "t1", "tags"), Literal(None, "k"))
+    root: Expression = FunctionCall(None, "f0", (f1, f2, lm, s))
+
+    assert root.transform(lambda e: e) is root
+
+    def replace_col(e: Expression) -> Expression:
+        if isinstance(e, Column) and e.column_name == "c2":
+            return Column(None, "t1", "c3")
+        return e
+
+    transformed = root.transform(replace_col)
+    assert isinstance(transformed, FunctionCall)
+    assert transformed is not root
+    new_f1, new_f2, new_lm, new_s = transformed.parameters
+    assert new_f1 is f1
+    assert isinstance(new_f2, CurriedFunctionCall)
+    assert new_f2 == CurriedFunctionCall(None, f1, (Column(None, "t1", "c3"),))
+    assert new_f2.internal_function is f1
+    assert new_lm is lm
+    assert new_s is s
+
+    def replace_arg(e: Expression) -> Expression:
+        if isinstance(e, Argument):
+            return Argument(None, "y")
+        return e
+
+    # Only a leaf nested in the lambda changes: the lambda, its inner
+    # function and the root are copied while every other subtree is reused.
+    transformed = root.transform(replace_arg)
+    assert isinstance(transformed, FunctionCall)
+    assert transformed is not root
+    new_f1, new_f2, new_lm, new_s = transformed.parameters
+    assert new_f1 is f1
+    assert new_f2 is f2
+    assert new_s is s
+    assert isinstance(new_lm, Lambda)
+    assert new_lm is not lm
+    assert new_lm == Lambda(
+        None, ("x",), FunctionCall(None, "f3", (Argument(None, "y"),))
+    )
+
+
 def test_hash() -> None:
     """
     Ensures expressions are hashable
@@ -0,0 +1,34 @@
+import copy
+import pickle
+
+from snuba.datasets.entities import EntityKey
+from snuba.datasets.entities.factory import get_entity
+from snuba.query.data_source.simple import Entity
+from snuba.query.logical import Query
+from snuba.request import Request
+from snuba.request.request_settings import HTTPRequestSettings
+
+
+def test_copy_and_pickle() -> None:
+    request = Request(
+        "a" * 32,
+        {"selected_columns": ["event_id"], "project": 1},
+        Query(Entity(EntityKey.EVENTS, get_entity(EntityKey.EVENTS).get_data_model())),
+        HTTPRequestSettings(),
+        "search",
+    )
+
+    shallow_copy = copy.copy(request)
+    assert shallow_copy == request
+    assert shallow_copy.body is request.body
+
+    deep_copy = copy.deepcopy(request)
+    assert deep_copy.id == request.id
+    assert deep_copy.body == request.body
+    assert deep_copy.body is not request.body
+    assert deep_copy.referrer == request.referrer
+
+    unpickled = pickle.loads(pickle.dumps(request))
+    assert unpickled.id == request.id
+    assert unpickled.body == request.body
+    assert unpickled.referrer == request.referrer
@@ -1,3 +1,5 @@
+from concurrent.futures import ThreadPoolExecutor
+
 from arroyo import Message, Topic
 from arroyo.backends.local.backend import LocalBroker as Broker
 from arroyo.backends.local.storages.memory import MemoryMessageStorage
@@ -35,3 +37,34 @@ def test_encoding_producer() -> None:
         assert getattr(encoded_message, attribute) == getattr(
             decoded_message, attribute
         )
+
+
+def test_encoding_producer_with_executor() -> None:
+    broker: Broker[str] = Broker(MemoryMessageStorage(), TestingClock())
+
+    topic = Topic("test")
+    broker.create_topic(topic, 1)
+
+    class ReverseEncoder(Encoder[str, str]):
+        def encode(self, value: str) -> str:
+            return "".join(value[::-1])
+
+    producer = ProducerEncodingWrapper(
+        broker.get_producer(), ReverseEncoder(), ThreadPoolExecutor(max_workers=1)
+    )
+    decoded_messages = [
+        future.result()
+        for future in [producer.produce(topic, value) for value in ["hello", "world"]]
+    ]
+    assert [message.payload for message in decoded_messages] == ["hello", "world"]
+
+    producer.close().result()
+
+    consumer = broker.get_consumer("group")
+    consumer.subscribe([topic])
+
+    # Messages should be produced in the order they were submitted.
+    for expected in ["olleh", "dlrow"]:
+        encoded_message = consumer.poll()
+        assert encoded_message is not None
+        assert encoded_message.payload == expected